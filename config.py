@@ -5,7 +5,7 @@ Easily customize gesture thresholds and settings
 
 import json
 import os
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
 from typing import Dict, Any
 
 @dataclass
@@ -25,11 +25,13 @@ class GestureConfig:
     # Performance settings
     smoothing_factor: float = 0.7  # 0.0 to 1.0, higher = smoother
     confidence_threshold: float = 0.7  # Hand detection confidence
+    hand_model_path: str = "hand_landmarker.task"  # MediaPipe Tasks model, used if present
     
     # Camera settings
     camera_width: int = 640
     camera_height: int = 480
     camera_fps: int = 30
+    camera_fourcc: str = "MJPG"  # Capture pixel format, "" keeps the driver default
     
     # Display settings
     show_fps: bool = True
@@ -38,9 +40,9 @@ class GestureConfig:
     
     def save_to_file(self, filename: str = "virtual_mouse_config.json"):
         """Save configuration to JSON file"""
-        config_dict = asdict(self)
+        config_dict = {name: getattr(self, name) for name in _FIELDS}
         with open(filename, 'w') as f:
-            json.dump(config_dict, f, indent=4)
+            json.dump(config_dict, f, indent=2)
         print(f"✅ Configuration saved to {filename}")
     
     @classmethod
@@ -99,6 +101,9 @@ class GestureConfig:
         else:
             print(f"❌ Preset '{preset_name}' not found. Available: {list(presets.keys())}")
 
+# Field names are fixed once the class is defined, so look them up only once
+_FIELDS = tuple(f.name for f in fields(GestureConfig))
+
 def create_config_wizard():
     """Interactive configuration wizard"""
     print("🧙‍♂️ Virtual Mouse Configuration Wizard")
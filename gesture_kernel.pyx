@@ -0,0 +1,23 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Gesture Kernel
+Compiled gesture classification used by virtual_mouse_enhanced.py when built
+"""
+
+# Landmark pairs per gesture, in GESTURE_NAMES order (see virtual_mouse_enhanced.py):
+# thumb-index, index-middle, thumb-index base, thumb-ring, thumb-pinky, thumb-index
+cdef int PAIR_A[6]
+cdef int PAIR_B[6]
+PAIR_A[:] = [4, 8, 4, 4, 4, 4]
+PAIR_B[:] = [8, 12, 5, 16, 20, 8]
+
+cpdef int classify(const float[:, ::1] pts, const float[::1] thr_sq) noexcept nogil:
+    """Index of the first gesture whose squared distance is under its threshold, or -1"""
+    cdef int k
+    cdef float dx, dy
+    for k in range(6):
+        dx = pts[PAIR_A[k], 0] - pts[PAIR_B[k], 0]
+        dy = pts[PAIR_A[k], 1] - pts[PAIR_B[k], 1]
+        if dx * dx + dy * dy < thr_sq[k]:
+            return k
+    return -1
@@ -0,0 +1,162 @@
+"""
+Native Mouse Backends
+Low-latency mouse input that bypasses pyautogui's per-call overhead
+"""
+
+import sys
+from dataclasses import dataclass
+from typing import Callable
+
+@dataclass
+class MouseBackend:
+    """Platform mouse operations used by the virtual mouse"""
+    name: str
+    move: Callable[[int, int], None]
+    click: Callable[[], None]
+    double_click: Callable[[], None]
+    right_click: Callable[[], None]
+    scroll: Callable[[int], None]  # Positive = up, same units as pyautogui.scroll on each platform
+
+def _windows_backend() -> MouseBackend:
+    """SendInput via ctypes"""
+    import ctypes
+    from ctypes import wintypes
+
+    MOUSEEVENTF_MOVE = 0x0001
+    MOUSEEVENTF_LEFTDOWN = 0x0002
+    MOUSEEVENTF_LEFTUP = 0x0004
+    MOUSEEVENTF_RIGHTDOWN = 0x0008
+    MOUSEEVENTF_RIGHTUP = 0x0010
+    MOUSEEVENTF_WHEEL = 0x0800
+    MOUSEEVENTF_ABSOLUTE = 0x8000
+    INPUT_MOUSE = 0
+
+    class MOUSEINPUT(ctypes.Structure):
+        _fields_ = [
+            ("dx", wintypes.LONG),
+            ("dy", wintypes.LONG),
+            ("mouseData", wintypes.DWORD),
+            ("dwFlags", wintypes.DWORD),
+            ("time", wintypes.DWORD),
+            ("dwExtraInfo", ctypes.c_size_t)
+        ]
+
+    class INPUT(ctypes.Structure):
+        _fields_ = [("type", wintypes.DWORD), ("mi", MOUSEINPUT)]
+
+    user32 = ctypes.windll.user32
+    # Absolute coordinates are normalized to 0..65535 over the primary screen
+    x_scale = 65535 / max(1, user32.GetSystemMetrics(0) - 1)
+    y_scale = 65535 / max(1, user32.GetSystemMetrics(1) - 1)
+
+    def send(*events):
+        inputs = (INPUT * len(events))(*(
+            INPUT(INPUT_MOUSE, MOUSEINPUT(dx, dy, data, flags, 0, 0))
+            for flags, dx, dy, data in events
+        ))
+        user32.SendInput(len(events), inputs, ctypes.sizeof(INPUT))
+
+    left_click = ((MOUSEEVENTF_LEFTDOWN, 0, 0, 0), (MOUSEEVENTF_LEFTUP, 0, 0, 0))
+    right_click = ((MOUSEEVENTF_RIGHTDOWN, 0, 0, 0), (MOUSEEVENTF_RIGHTUP, 0, 0, 0))
+
+    return MouseBackend(
+        name="win32",
+        move=lambda x, y: send((MOUSEEVENTF_MOVE | MOUSEEVENTF_ABSOLUTE,
+                                int(x * x_scale), int(y * y_scale), 0)),
+        click=lambda: send(*left_click),
+        double_click=lambda: send(*left_click, *left_click),
+        right_click=lambda: send(*right_click),
+        # Raw wheel delta (120 = one notch), as pyautogui.scroll sends it on Windows
+        scroll=lambda amount: send((MOUSEEVENTF_WHEEL, 0, 0, amount & 0xFFFFFFFF))
+    )
+
+def _macos_backend() -> MouseBackend:
+    """Quartz CGEvents"""
+    import Quartz
+
+    def position():
+        return Quartz.CGEventGetLocation(Quartz.CGEventCreate(None))
+
+    def post(event_type, button, click_state=1):
+        event = Quartz.CGEventCreateMouseEvent(None, event_type, position(), button)
+        Quartz.CGEventSetIntegerValueField(event, Quartz.kCGMouseEventClickState, click_state)
+        Quartz.CGEventPost(Quartz.kCGHIDEventTap, event)
+
+    def move(x, y):
+        event = Quartz.CGEventCreateMouseEvent(
+            None, Quartz.kCGEventMouseMoved, (x, y), Quartz.kCGMouseButtonLeft)
+        Quartz.CGEventPost(Quartz.kCGHIDEventTap, event)
+
+    def click(click_state=1):
+        post(Quartz.kCGEventLeftMouseDown, Quartz.kCGMouseButtonLeft, click_state)
+        post(Quartz.kCGEventLeftMouseUp, Quartz.kCGMouseButtonLeft, click_state)
+
+    def double_click():
+        click(1)
+        click(2)
+
+    def right_click():
+        post(Quartz.kCGEventRightMouseDown, Quartz.kCGMouseButtonRight)
+        post(Quartz.kCGEventRightMouseUp, Quartz.kCGMouseButtonRight)
+
+    def scroll(amount):
+        event = Quartz.CGEventCreateScrollWheelEvent(None, Quartz.kCGScrollEventUnitLine, 1, amount)
+        Quartz.CGEventPost(Quartz.kCGHIDEventTap, event)
+
+    return MouseBackend("quartz", move, click, double_click, right_click, scroll)
+
+def _xlib_backend() -> MouseBackend:
+    """XTest fake input on X11"""
+    from Xlib import X, display
+    from Xlib.ext import xtest
+
+    dpy = display.Display()
+
+    def press(button, times=1):
+        for _ in range(times):
+            xtest.fake_input(dpy, X.ButtonPress, button)
+            xtest.fake_input(dpy, X.ButtonRelease, button)
+        dpy.flush()
+
+    def move(x, y):
+        xtest.fake_input(dpy, X.MotionNotify, x=int(x), y=int(y))
+        dpy.flush()
+
+    def scroll(amount):
+        # Buttons 4/5 are wheel up/down, one press per notch
+        press(4 if amount > 0 else 5, abs(amount))
+
+    return MouseBackend(
+        name="xlib",
+        move=move,
+        click=lambda: press(1),
+        double_click=lambda: press(1, 2),
+        right_click=lambda: press(3),
+        scroll=scroll
+    )
+
+def _pyautogui_backend() -> MouseBackend:
+    """Portable fallback"""
+    import pyautogui
+
+    return MouseBackend(
+        name="pyautogui",
+        move=pyautogui.moveTo,
+        click=pyautogui.click,
+        double_click=pyautogui.doubleClick,
+        right_click=pyautogui.rightClick,
+        scroll=pyautogui.scroll
+    )
+
+def create_mouse_backend() -> MouseBackend:
+    """Return the native backend for this platform, falling back to pyautogui"""
+    try:
+        if sys.platform == "win32":
+            return _windows_backend()
+        if sys.platform == "darwin":
+            return _macos_backend()
+        if sys.platform.startswith("linux"):
+            return _xlib_backend()
+    except Exception as e:
+        print(f"⚠️ Native mouse input unavailable ({e}), using pyautogui")
+    return _pyautogui_backend()
@@ -0,0 +1,14 @@
+"""
+Build the optional compiled gesture kernel next to the scripts:
+    pip install cython
+    python setup.py build_ext --inplace
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="virtual-mouse-gesture-kernel",
+    py_modules=[],
+    ext_modules=cythonize("gesture_kernel.pyx")
+)
@@ -1,21 +1,78 @@
 import cv2 
 import mediapipe as mp 
+import numpy as np
+import os
 import pyautogui
 import sys
+import threading
+import time
+from config import GestureConfig
 
-# Initialize MediaPipe hands - try different approaches
-try:
-    # Try the older solutions API
-    hand_detector = mp.solutions.hands.Hands()
-    drawing_utils = mp.solutions.drawing_utils
-except AttributeError:
+# Cursor updates happen every frame; skip pyautogui's post-call sleep and corner check
+pyautogui.PAUSE = 0
+pyautogui.FAILSAFE = False
+
+
+class FrameGrabber(threading.Thread):
+    """Read camera frames on a background thread, keeping only the latest one"""
+
+    def __init__(self, cap):
+        super().__init__(daemon=True)
+        self.cap = cap
+        self.lock = threading.Lock()
+        self.new_frame = threading.Event()
+        self.ret, self.frame = self.cap.read()
+        self.new_frame.set()
+        self.stopped = False
+
+    def run(self):
+        while not self.stopped:
+            ret, frame = self.cap.read()
+            with self.lock:
+                self.ret, self.frame = ret, frame
+                self.new_frame.set()
+            if not ret:
+                break
+
+    def read(self):
+        """Wait for a frame newer than the last one read and return the (ret, frame) pair"""
+        # Short waits keep Ctrl+C responsive while the camera is slow
+        while not self.new_frame.wait(0.5):
+            pass
+        with self.lock:
+            self.new_frame.clear()
+            return self.ret, self.frame
+
+    def stop(self):
+        self.stopped = True
+        self.join()
+
+
+cfg = GestureConfig.load_from_file()
+
+# Initialize MediaPipe hands - prefer the Tasks hand landmarker when its model is available
+landmarker = hand_detector = None
+if os.path.exists(cfg.hand_model_path):
+    from mediapipe.tasks.python import BaseOptions, vision
+    landmarker = vision.HandLandmarker.create_from_options(vision.HandLandmarkerOptions(
+        base_options=BaseOptions(model_asset_path=cfg.hand_model_path),
+        running_mode=vision.RunningMode.VIDEO,
+        num_hands=1))
+else:
     try:
-        # Try direct hands access
-        hand_detector = mp.hands.Hands()
-        drawing_utils = mp.drawing_utils
+        # Try the older solutions API
+        hand_detector = mp.solutions.hands.Hands()
     except AttributeError:
-        print("Error: MediaPipe version not compatible. Please install: pip install mediapipe==0.9.0.1")
-        sys.exit(1)
+        try:
+            # Try direct hands access
+            hand_detector = mp.hands.Hands()
+        except AttributeError:
+            print("Error: MediaPipe version not compatible. Please install: pip install mediapipe==0.9.0.1")
+            sys.exit(1)
+
+# Run without a preview window (and without drawing) with --headless; quit with Ctrl+C
+HEADLESS = '--headless' in sys.argv
+DRAW_LANDMARKS = cfg.show_landmarks and not HEADLESS
 
 # Initialize camera with error handling
 cap = cv2.VideoCapture(0)
@@ -23,15 +80,44 @@ if not cap.isOpened():
     print("Error: Could not open camera")
     sys.exit(1)
 
+# Keep a single frame in the driver queue so reads are never stale
+cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+cap.set(cv2.CAP_PROP_FRAME_WIDTH, cfg.camera_width)
+cap.set(cv2.CAP_PROP_FRAME_HEIGHT, cfg.camera_height)
+
+# Capture runs on its own thread so inference never waits on camera I/O
+grabber = FrameGrabber(cap)
+if not grabber.ret:
+    print("Error: Could not read frame")
+    cap.release()
+    sys.exit(1)
+grabber.start()
+
+# Camera resolution is fixed for the session, so the coordinate scales are too.
+# They come from a real frame, since the reported capture size can differ (or be 0)
+frame_height, frame_width = grabber.frame.shape[:2]
 screen_width, screen_height = pyautogui.size()
+frame_scale = np.array([frame_width, frame_height], dtype=np.float32)
+screen_scale = np.array([screen_width, screen_height], dtype=np.float32)
+
+# Landmark ids used for gestures
+THUMB_TIP = 4
+INDEX_MCP = 5
+INDEX_TIP = 8
+MIDDLE_TIP = 12
+RING_TIP = 16
+PINKY_TIP = 20
+KEY_POINTS = [THUMB_TIP, INDEX_MCP, INDEX_TIP, MIDDLE_TIP, RING_TIP, PINKY_TIP]
 
-# Initialize variables outside the loop
-index_x = index_y = 0
-thumb_x = thumb_y = 0
-middle_x = middle_y = 0
-index2_x = index2_y = 0
-ring_x = ring_y = 0
-pinky_x = pinky_y = 0
+# Landmark index pairs forming the hand skeleton (same as mp.solutions.hands.HAND_CONNECTIONS,
+# which the Tasks API does not provide)
+HAND_CONNECTIONS = (
+    (0, 1), (1, 2), (2, 3), (3, 4),
+    (0, 5), (5, 6), (6, 7), (7, 8),
+    (5, 9), (9, 10), (10, 11), (11, 12),
+    (9, 13), (13, 14), (14, 15), (15, 16),
+    (13, 17), (0, 17), (17, 18), (18, 19), (19, 20)
+)
 
 # Gesture thresholds (adjustable)
 CLICK_THRESHOLD = 20
@@ -39,104 +125,160 @@ DOUBLE_CLICK_THRESHOLD = 10
 RIGHT_CLICK_THRESHOLD = 20
 SCROLL_THRESHOLD = 20
 MOVE_THRESHOLD = 100
-ACTION_DELAY = 0.2  # Reduced delay for better responsiveness 
 
-while True: 
-    ret, frame = cap.read() 
-    if not ret:
-        print("Error: Could not read frame")
-        break
+# Gestures compare squared 2D distances against squared thresholds (no sqrt)
+CLICK_T2 = CLICK_THRESHOLD ** 2
+DOUBLE_CLICK_T2 = DOUBLE_CLICK_THRESHOLD ** 2
+RIGHT_CLICK_T2 = RIGHT_CLICK_THRESHOLD ** 2
+SCROLL_T2 = SCROLL_THRESHOLD ** 2
+MOVE_T2 = MOVE_THRESHOLD ** 2
+
+# Cursor moves smaller than this many pixels are skipped
+MOVE_DEADBAND = 3
+DEADBAND_SQ = MOVE_DEADBAND ** 2
+prev_x = prev_y = 0
+
+# Exponential smoothing of the cursor target, higher factor = smoother
+SMOOTHING = cfg.smoothing_factor
+smooth_x = smooth_y = None
+
+# Timestamps of the last action of each kind, for the non-blocking cooldown
+last_click_ts = last_dclick_ts = last_rclick_ts = last_scroll_ts = 0
+
+# Hand detection runs on a downscaled copy; landmarks come back normalized
+INFERENCE_SIZE = (320, 240)
+
+# With --opencl, resize and color conversion go through OpenCV's T-API (UMat) so
+# they can run on an OpenCL device such as an iGPU; otherwise they stay on the CPU
+USE_OPENCL = '--opencl' in sys.argv and cv2.ocl.haveOpenCL()
+cv2.ocl.setUseOpenCL(USE_OPENCL)
+
+# Reused every frame so resizing and color conversion never allocate
+small = np.empty((INFERENCE_SIZE[1], INFERENCE_SIZE[0], 3), dtype=np.uint8)
+rgb_small = np.empty_like(small)
+
+# While a hand is tracked, detection only runs every DETECTION_INTERVAL frames
+DETECTION_INTERVAL = 2
+frame_idx = 0
+last_hands = None
+detect_ts = 0  # VIDEO mode needs strictly increasing timestamps (ms)
+
+# The preview window is refreshed at ~30 Hz; HighGUI calls stay on the main
+# thread, which macOS requires
+DISPLAY_INTERVAL = 1 / 30
+last_display = 0.0
+
+try:
+    while True: 
+        ret, frame = grabber.read() 
+        if not ret:
+            print("Error: Could not read frame")
+            break
         
-    frame = cv2.flip(frame, 1) 
-    frame_height, frame_width, _ = frame.shape 
-    rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB) 
-    output = hand_detector.process(rgb_frame)
-    hands = output.multi_hand_landmarks
-    if hands: 
-        for hand in hands: 
-            drawing_utils.draw_landmarks(frame, hand) 
-            landmarks = hand.landmark 
-            for id, landmark in enumerate(landmarks): 
-                x = int(landmark.x*frame_width) 
-                y = int(landmark.y*frame_height) 
-                if id == 8: 
-                    cv2.circle(img=frame, center=(x,y), radius=10, color=(0, 255, 255)) 
-                    index_x = screen_width/frame_width*x 
-                    index_y = screen_height/frame_height*y
-                if id == 4: 
-                    cv2.circle(img=frame, center=(x,y), radius=10, color=(0, 255, 255)) 
-                    thumb_x = screen_width/frame_width*x 
-                    thumb_y = screen_height/frame_height*y 
-                    
-                    # Click gesture: thumb and index finger close
-                    if abs(index_y - thumb_y) < CLICK_THRESHOLD: 
+        now = time.monotonic()
+        frame = cv2.flip(frame, 1) 
+        frame_idx += 1
+        if not last_hands or frame_idx % DETECTION_INTERVAL == 0:
+            if USE_OPENCL:
+                u_small = cv2.resize(cv2.UMat(frame), INFERENCE_SIZE, interpolation=cv2.INTER_AREA)
+                # MediaPipe needs a host NumPy buffer, so download the result
+                rgb_small = cv2.cvtColor(u_small, cv2.COLOR_BGR2RGB).get()
+            else:
+                cv2.resize(frame, INFERENCE_SIZE, dst=small, interpolation=cv2.INTER_AREA)
+                cv2.cvtColor(small, cv2.COLOR_BGR2RGB, dst=rgb_small) 
+            if landmarker is not None:
+                detect_ts = max(int(now * 1000), detect_ts + 1)
+                mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb_small)
+                last_hands = landmarker.detect_for_video(mp_image, detect_ts).hand_landmarks
+            else:
+                output = hand_detector.process(rgb_small)
+                last_hands = [hand.landmark for hand in output.multi_hand_landmarks or ()]
+        hands = last_hands
+        if hands: 
+            for landmarks in hands: 
+                if DRAW_LANDMARKS:
+                    # Pull all 21 (x, y) pairs into one array and scale them in bulk
+                    pts = np.fromiter((c for lm in landmarks for c in (lm.x, lm.y)),
+                                      dtype=np.float32, count=42).reshape(21, 2)
+                    frame_pts = (pts * frame_scale).astype(np.int32)
+                    points = [tuple(p) for p in frame_pts.tolist()]
+                    # Skeleton first, then joints, as drawing_utils.draw_landmarks did
+                    for start, end in HAND_CONNECTIONS:
+                        cv2.line(frame, points[start], points[end], (224, 224, 224), 2)
+                    for x, y in frame_pts:
+                        cv2.circle(img=frame, center=(int(x), int(y)), radius=2, color=(0, 0, 255), thickness=2)
+                    for x, y in frame_pts[KEY_POINTS]:
+                        cv2.circle(img=frame, center=(int(x), int(y)), radius=10, color=(0, 255, 255))
+                    key_pts = pts[KEY_POINTS]
+                else:
+                    # Nothing to draw, so only the gesture landmarks are needed
+                    key_pts = np.array([[landmarks[i].x, landmarks[i].y] for i in KEY_POINTS],
+                                       dtype=np.float32)
+                L = dict(zip(KEY_POINTS, key_pts * screen_scale))
+
+                index_x, index_y = L[INDEX_TIP]
+                if smooth_x is None:
+                    smooth_x, smooth_y = index_x, index_y
+                else:
+                    smooth_x = SMOOTHING * smooth_x + (1 - SMOOTHING) * index_x
+                    smooth_y = SMOOTHING * smooth_y + (1 - SMOOTHING) * index_y
+                thumb = L[THUMB_TIP]
+                d = thumb - L[INDEX_TIP]
+                thumb_index_d2 = d @ d
+
+                # Click gesture: thumb and index finger close
+                if thumb_index_d2 < CLICK_T2: 
+                    if now - last_click_ts > cfg.action_cooldown:
                         pyautogui.click()   
-                        pyautogui.sleep(ACTION_DELAY) 
-                    # Move gesture: thumb and index finger moderately close
-                    elif abs(index_y - thumb_y) < MOVE_THRESHOLD: 
-                        pyautogui.moveTo(index_x, index_y)
-                if id == 12:
-                    cv2.circle(img=frame, center=(x,y), radius=10, color=(0, 255, 255)) 
-                    middle_x = screen_width/frame_width*x 
-                    middle_y = screen_height/frame_height*y  
-                    
-                    # Double click gesture: index and middle fingers close
-                    if abs(index_y - middle_y) < DOUBLE_CLICK_THRESHOLD: 
-                        pyautogui.doubleClick() 
-                        pyautogui.sleep(ACTION_DELAY)
-                if id == 5: 
-                    cv2.circle(img=frame, center=(x,y), radius=10, color=(0, 255, 255))
-                    index2_x = screen_width/frame_width*x 
-                    index2_y = screen_height/frame_height*y
-                    
-                    # Right click gesture: thumb and index finger base close
-                    if abs(index2_y - thumb_y) < RIGHT_CLICK_THRESHOLD:
+                        last_click_ts = now
+                # Move gesture: thumb and index finger moderately close
+                elif thumb_index_d2 < MOVE_T2: 
+                    if (smooth_x - prev_x) ** 2 + (smooth_y - prev_y) ** 2 > DEADBAND_SQ:
+                        pyautogui.moveTo(smooth_x, smooth_y)
+                        prev_x, prev_y = smooth_x, smooth_y
+
+                # Right click gesture: thumb and index finger base close
+                d = thumb - L[INDEX_MCP]
+                if d @ d < RIGHT_CLICK_T2:
+                    if now - last_rclick_ts > cfg.action_cooldown:
                         pyautogui.rightClick()
-                        pyautogui.sleep(ACTION_DELAY)
-                    # elif abs(index2_y - thumb_y) < 10:
-                    #     pyautogui.dragTo(index2_y, thumb_y, button="")
-
-                if id == 16: 
-                    cv2.circle(img=frame, center=(x,y), radius=10, color=(0, 255, 255))
-                    ring_x = screen_width/frame_width*x 
-                    ring_y = screen_height/frame_height*y
-                if id == 20: 
-                    cv2.circle(img=frame, center=(x,y), radius=10, color=(0, 255, 255))
-                    pinky_x = screen_width/frame_width*x 
-                    pinky_y = screen_height/frame_height*y
-                    if abs(ring_y - thumb_y) < SCROLL_THRESHOLD:
+                        last_rclick_ts = now
+
+                # Double click gesture: index and middle fingers close
+                d = L[INDEX_TIP] - L[MIDDLE_TIP]
+                if d @ d < DOUBLE_CLICK_T2: 
+                    if now - last_dclick_ts > cfg.action_cooldown:
+                        pyautogui.doubleClick() 
+                        last_dclick_ts = now
+
+                # Scroll gestures: thumb and ring / pinky finger close
+                if now - last_scroll_ts > cfg.action_cooldown:
+                    d = thumb - L[RING_TIP]
+                    if d @ d < SCROLL_T2:
                         pyautogui.scroll(70)
-                        pyautogui.sleep(ACTION_DELAY)
-                    elif abs(thumb_y - pinky_y) < SCROLL_THRESHOLD:
-                        pyautogui.scroll(-70)
-                        pyautogui.sleep(ACTION_DELAY)
-                    
-                # if id == 20: 
-                #     cv2.circle(img=frame, center=(x,y), radius=10, color=(255, 0, 255))
-                #     pinky_x = screen_width/frame_width*x 
-                #     pinky_y = screen_height/frame_height*y
-                # if id == 17: 
-                #     cv2.circle(img=frame, center=(x,y), radius=10, color=(255, 0, 255))
-                #     pinky2_x = screen_width/frame_width*x 
-                #     pinky2_y = screen_height/frame_height*y
-                #     if abs(pinky2_y - pinky_y) < 20:
-                #         pyautogui.hscroll(-70)
-                #         pyautogui.sleep(0.5)
-                # if id == 2: 
-                #     cv2.circle(img=frame, center=(x,y), radius=10, color=(255, 0, 255))
-                #     thumb2_x = screen_width/frame_width*x
-                #     thumb2_y = screen_height/frame_height*y
-                #     if abs(thumb2_y - thumb_y) < 20:
-                #         pyautogui.hscroll(70)
-                #         pyautogui.sleep(0.5)
-
-                
-    cv2.imshow('Virtual Mouse', frame) 
-    
-    # Exit on 'q' key press
-    if cv2.waitKey(1) & 0xFF == ord('q'):
-        break
+                        last_scroll_ts = now
+                    else:
+                        d = thumb - L[PINKY_TIP]
+                        if d @ d < SCROLL_T2:
+                            pyautogui.scroll(-70)
+                            last_scroll_ts = now
+
+        if not HEADLESS:
+            if now - last_display >= DISPLAY_INTERVAL:
+                last_display = now
+                cv2.imshow('Virtual Mouse', frame)
+                key = cv2.waitKey(1)
+            else:
+                # Non-blocking check so the quit key still works between redraws
+                key = cv2.pollKey()
+            # Exit on 'q' key press
+            if key & 0xFF == ord('q'):
+                break
+except KeyboardInterrupt:
+    pass
 
 # Cleanup
+grabber.stop()
 cap.release()
+(landmarker or hand_detector).close()
 cv2.destroyAllWindows()
\ No newline at end of file
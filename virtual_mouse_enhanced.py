@@ -2,26 +2,184 @@ import cv2
 import mediapipe as mp
 import pyautogui
 import sys
+import threading
 import time
-import math
+import os
+import queue
 import numpy as np
 from collections import deque
 from dataclasses import dataclass
-from typing import Tuple, Optional
+from typing import Optional
 from config import GestureConfig
+from native_mouse import create_mouse_backend
+
+# Cursor moves are issued every frame; when pyautogui is the input backend, skip its
+# post-call sleep and corner check
+pyautogui.PAUSE = 0
+pyautogui.FAILSAFE = False
+
+# Per-frame OpenCV work here is tiny; thread-pool wake-ups and OpenCL dispatch cost
+# more than they save. Raise the thread count to 2 on high-resolution cameras.
+OPENCV_THREADS = 1
+cv2.setNumThreads(OPENCV_THREADS)
+cv2.ocl.setUseOpenCL(False)
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    # Numba is optional; without it gesture math falls back to NumPy
+    HAVE_NUMBA = False
+
+# Landmark index pairs forming the hand skeleton (same as mp.solutions.hands.HAND_CONNECTIONS)
+HAND_CONNECTIONS = (
+    (0, 1), (1, 2), (2, 3), (3, 4),
+    (0, 5), (5, 6), (6, 7), (7, 8),
+    (5, 9), (9, 10), (10, 11), (11, 12),
+    (9, 13), (13, 14), (14, 15), (15, 16),
+    (13, 17), (0, 17), (17, 18), (18, 19), (19, 20)
+)
+
+# Key landmarks: index, thumb, middle, index base, ring, pinky
+GESTURE_LANDMARKS = (8, 4, 12, 5, 16, 20)
+
+# Gestures in priority order; the first one whose distance is under its threshold wins
+GESTURE_NAMES = ("click", "double_click", "right_click", "scroll_up", "scroll_down", "move")
+
+# Landmark pairs whose distances drive each gesture above:
+# thumb-index, index-middle, thumb-index base, thumb-ring, thumb-pinky, thumb-index
+_PAIR_A = np.array([4, 8, 4, 4, 4, 4])
+_PAIR_B = np.array([8, 12, 5, 16, 20, 8])
+
+def _landmarks_to_np(landmarks) -> np.ndarray:
+    """Copy 21 MediaPipe landmarks into a (21, 3) float32 array of normalized x, y, z"""
+    return np.fromiter((v for lm in landmarks for v in (lm.x, lm.y, lm.z)),
+                       dtype=np.float32, count=63).reshape(21, 3)
+
+if HAVE_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def _gesture_distances(lms):
+        """Squared distances between the _PAIR_A/_PAIR_B landmarks"""
+        out = np.empty(len(_PAIR_A), dtype=np.float32)
+        for k in range(len(_PAIR_A)):
+            dx = lms[_PAIR_A[k], 0] - lms[_PAIR_B[k], 0]
+            dy = lms[_PAIR_A[k], 1] - lms[_PAIR_B[k], 1]
+            out[k] = dx * dx + dy * dy
+        return out
+else:
+    def _gesture_distances(lms):
+        """Squared distances between the _PAIR_A/_PAIR_B landmarks"""
+        d = lms[_PAIR_A, :2] - lms[_PAIR_B, :2]
+        return (d * d).sum(axis=1)
+
+try:
+    # Optional compiled kernel, built with: python setup.py build_ext --inplace
+    from gesture_kernel import classify as _classify_gesture
+except ImportError:
+    def _classify_gesture(lms, thr_sq):
+        """Index into GESTURE_NAMES of the first gesture under its squared threshold, or -1"""
+        # Compare every distance at once; argmax picks the highest-priority match
+        matches = _gesture_distances(lms) < thr_sq
+        winner = int(matches.argmax())
+        return winner if matches[winner] else -1
+
+# Wider frames are downscaled (keeping aspect ratio) before hand detection; the
+# palm detector works at ~200 px internally and landmarks come back normalized
+MAX_INFERENCE_WIDTH = 640
+
+# Hand detection is skipped while the mean gray-level change of a 64 px wide
+# thumbnail stays below MOTION_THRESHOLD, for at most MAX_SKIPPED_DETECTIONS frames
+MOTION_THRESHOLD = 2.0
+MAX_SKIPPED_DETECTIONS = 2
+
+# Held scroll gestures are coalesced into one scroll event per interval (seconds).
+# The loop runs once per camera frame, so this must span several frames (~3 at 30 FPS)
+# to merge anything; the total scroll distance is unchanged
+SCROLL_EMIT_INTERVAL = 0.1
+
+# Static on-screen help, rendered once into an overlay
+INSTRUCTIONS = (
+    "Move: Thumb + Index close",
+    "Click: Thumb + Index very close", 
+    "Double Click: Index + Middle close",
+    "Right Click: Thumb + Index base close",
+    "Scroll: Thumb + Ring/Pinky close",
+    "Press 'q' to quit"
+)
 
 @dataclass
 class HandState:
     """Track hand state for smooth interactions"""
     last_click_time: float = 0
-    last_position: Tuple[float, float] = (0, 0)
-    position_history: deque = None
     is_dragging: bool = False
     gesture_active: Optional[str] = None
+
+class ThreadedCamera:
+    """Capture frames on a background thread, keeping only the newest one"""
+    
+    def __init__(self, config: GestureConfig, src: int = 0):
+        self.cap = cv2.VideoCapture(src)
+        self.latest = None
+        self.lock = threading.Lock()
+        self.new_frame = threading.Event()
+        self.stopped = False
+        self.failed = False
+        
+        if self.cap.isOpened():
+            # Optimize camera settings before the reader thread starts. Many UVC
+            # cameras only offer 30/60 FPS at higher resolutions in MJPG, not YUYV
+            if config.camera_fourcc:
+                self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*config.camera_fourcc))
+            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, config.camera_width)
+            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, config.camera_height)
+            self.cap.set(cv2.CAP_PROP_FPS, config.camera_fps)
+            self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+            
+            if config.camera_fourcc:
+                code = int(self.cap.get(cv2.CAP_PROP_FOURCC))
+                actual = "".join(chr((code >> 8 * i) & 0xFF) for i in range(4))
+                if actual != config.camera_fourcc:
+                    print(f"⚠️ Camera did not accept {config.camera_fourcc} format (using {actual!r})")
+            
+            self.thread = threading.Thread(target=self._reader, daemon=True)
+            self.thread.start()
+    
+    def is_opened(self) -> bool:
+        return self.cap.isOpened()
+    
+    def _reader(self):
+        """Grab frames as fast as the camera delivers them"""
+        try:
+            while not self.stopped:
+                ret = self.cap.grab()
+                frame = self.cap.retrieve()[1] if ret else None
+                with self.lock:
+                    self.latest = frame
+                    self.failed = frame is None
+                    self.new_frame.set()
+                if frame is None:
+                    break
+        finally:
+            # The capture is released here, so it is never freed under a running grab()
+            self.cap.release()
     
-    def __post_init__(self):
-        if self.position_history is None:
-            self.position_history = deque(maxlen=5)
+    def read(self) -> Optional[np.ndarray]:
+        """Wait for a frame newer than the last one read and return it (None once capture fails)"""
+        # Slow first frames and USB stalls are waited out; short waits keep Ctrl+C responsive
+        while not self.new_frame.wait(0.5):
+            if self.failed or not self.thread.is_alive():
+                return None
+        with self.lock:
+            self.new_frame.clear()
+            return self.latest
+    
+    def release(self):
+        self.stopped = True
+        if hasattr(self, "thread"):
+            # The reader releases the capture once its current grab() returns
+            self.thread.join(timeout=1.0)
+        else:
+            self.cap.release()
 
 class VirtualMouse:
     """Enhanced Virtual Mouse with advanced gesture recognition and smooth tracking"""
@@ -31,219 +189,348 @@ class VirtualMouse:
         self.screen_width, self.screen_height = pyautogui.size()
         self.hand_state = HandState()
         
-        # Initialize MediaPipe with optimized settings
-        self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(
-            static_image_mode=False,
-            max_num_hands=1,
-            min_detection_confidence=0.8,
-            min_tracking_confidence=0.5
-        )
-        self.mp_drawing = mp.solutions.drawing_utils
+        # Emit input events through the platform's native API where available
+        self.mouse = create_mouse_backend()
         
-        # Initialize camera with optimized settings
-        self.cap = cv2.VideoCapture(0)
-        if not self.cap.isOpened():
+        # Initialize MediaPipe with optimized settings. A (quantized) Tasks model is
+        # preferred when present; otherwise fall back to the legacy Solutions API
+        self.landmarker = None
+        self.hands = None
+        self._latest_landmarks = None
+        self._timestamp_ms = 0
+        if os.path.exists(self.config.hand_model_path):
+            from mediapipe.tasks.python import BaseOptions, vision
+            self.landmarker = vision.HandLandmarker.create_from_options(vision.HandLandmarkerOptions(
+                base_options=BaseOptions(model_asset_path=self.config.hand_model_path),
+                running_mode=vision.RunningMode.LIVE_STREAM,
+                num_hands=1,
+                min_hand_detection_confidence=0.8,
+                min_tracking_confidence=0.5,
+                result_callback=self._on_result
+            ))
+        else:
+            self.mp_hands = mp.solutions.hands
+            self.hands = self.mp_hands.Hands(
+                static_image_mode=False,
+                max_num_hands=1,
+                model_complexity=0,  # Lite model, plenty for cursor control
+                min_detection_confidence=0.8,
+                min_tracking_confidence=0.5
+            )
+            
+            # Solutions inference is synchronous, so it runs on a worker thread. Each
+            # queue holds one item and the oldest is dropped: the worker always gets
+            # the newest frame and the main loop the newest result
+            self._infer_in = queue.Queue(maxsize=1)
+            self._infer_out = queue.Queue(maxsize=1)
+            # RGB buffers not owned by the worker; three cover the frame being
+            # processed, the one waiting in _infer_in and the one being filled
+            self._rgb_free = queue.SimpleQueue()
+            for _ in range(3):
+                self._rgb_free.put(None)
+            self._infer_thread = threading.Thread(target=self._inference_worker, daemon=True)
+            self._infer_thread.start()
+        
+        # Initialize camera with optimized settings; frames are read on a background thread
+        self.cam = ThreadedCamera(self.config)
+        if not self.cam.is_opened():
             print("Error: Could not open camera")
             sys.exit(1)
-            
-        # Optimize camera settings
-        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.config.camera_width)
-        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.config.camera_height)
-        self.cap.set(cv2.CAP_PROP_FPS, self.config.camera_fps)
-        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
         
-        # Performance tracking
-        self.frame_count = 0
-        self.start_time = time.time()
+        # Detection is skipped while the scene is static; the last result is reused
+        self._prev_tiny = None
+        self._skipped_detections = 0
+        
+        # Inference buffers for MediaPipe, allocated on the first frame and reused
+        self._small = None
+        # With the Tasks API one RGB buffer is enough: mp.Image copies its input
+        self._rgb = None
+        
+        # Performance tracking (exponential moving average of the loop rate)
+        self._last_tick = time.perf_counter()
         self.fps = 0
         
+        # Display is refreshed at most this often; tracking runs every frame
+        self._display_interval = 1 / 30
+        self._last_display = 0.0
+        
+        # Instructions overlay, rendered on the first drawn frame
+        self._instr_overlay = None
+        self._instr_mask = None
+        self._instr_shape = None
+        self._instr_top = 0
+        
         # Gesture state tracking
         self.last_gesture_time = 0
         self.gesture_cooldown = self.config.gesture_cooldown
         
-    def calculate_distance(self, point1: Tuple[float, float], point2: Tuple[float, float]) -> float:
-        """Calculate Euclidean distance between two points"""
-        return math.sqrt((point1[0] - point2[0])**2 + (point1[1] - point2[1])**2)
+        # Squared thresholds in GESTURE_NAMES order (distances are never square-rooted)
+        self._thr = np.array([
+            self.config.click_threshold,
+            self.config.double_click_threshold,
+            self.config.right_click_threshold,
+            self.config.scroll_threshold,
+            self.config.scroll_threshold,
+            self.config.move_threshold
+        ], dtype=np.float32) ** 2
+        
+        # Cursor mapping constants and smoothing state for the move gesture
+        self._sx = float(self.screen_width)
+        self._sy = float(self.screen_height)
+        self._sx_max = self.screen_width - 1
+        self._sy_max = self.screen_height - 1
+        self._sf = self.config.smoothing_factor
+        self._one_minus_sf = 1 - self._sf
+        self._last_x = self._last_y = None
+        
+        # Last cursor position sent to the OS, to skip redundant moves
+        self._last_emitted_xy = (-1, -1)
+        
+        # Pending scroll steps, flushed as a single event per SCROLL_EMIT_INTERVAL
+        self._scroll_accum = 0
+        self._last_scroll_emit = 0.0
+        
+        # Action messages are written to stdout by a background thread, keeping
+        # console I/O off the gesture path
+        self._log_q = deque()
+        self._log_stopped = False
+        self._log_thread = threading.Thread(target=self._drain, daemon=True)
+        self._log_thread.start()
+        
+    def _drain(self):
+        """Write queued log messages to stdout until stopped and the queue is empty"""
+        pending = False
+        while True:
+            try:
+                sys.stdout.write(self._log_q.popleft() + "\n")
+                pending = True
+            except IndexError:
+                if pending:
+                    sys.stdout.flush()
+                    pending = False
+                if self._log_stopped:
+                    break
+                time.sleep(0.01)
     
-    def smooth_position(self, new_pos: Tuple[float, float]) -> Tuple[float, float]:
-        """Apply smoothing filter to reduce jitter"""
-        if self.hand_state.last_position == (0, 0):
-            self.hand_state.last_position = new_pos
-            return new_pos
+    def _on_result(self, result, output_image, timestamp_ms: int):
+        """HandLandmarker LIVE_STREAM callback, invoked on MediaPipe's thread"""
+        self._latest_landmarks = result.hand_landmarks[0] if result.hand_landmarks else None
+    
+    def detect_hands(self, rgb_frame, now: float):
+        """Start hand detection on rgb_frame; the result is picked up by latest_landmarks()"""
+        if self.landmarker is not None:
+            # LIVE_STREAM timestamps must increase strictly; the result arrives via
+            # _on_result. mp.Image copies the pixels into its own frame, so the
+            # caller may refill rgb_frame as soon as this returns
+            self._timestamp_ms = max(int(now * 1000), self._timestamp_ms + 1)
+            mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb_frame)
+            self.landmarker.detect_async(mp_image, self._timestamp_ms)
+            return
+        
+        self._submit_inference(rgb_frame)
+    
+    def latest_landmarks(self):
+        """The 21 landmarks of the first hand from the most recent completed detection, or None"""
+        if self.hands is not None:
+            try:
+                self._latest_landmarks = self._infer_out.get_nowait()
+            except queue.Empty:
+                pass
+        return self._latest_landmarks
+    
+    def _submit_inference(self, rgb_frame):
+        """Queue a frame for the inference worker, replacing one it has not started on"""
+        try:
+            stale = self._infer_in.get_nowait()
+            if stale is not None:
+                self._rgb_free.put(stale)
+        except queue.Empty:
+            pass
+        self._infer_in.put(rgb_frame)
+    
+    def _inference_worker(self):
+        """Run Solutions hand detection on queued frames until a None frame arrives"""
+        last_error = None
+        while True:
+            rgb_frame = self._infer_in.get()
+            if rgb_frame is None:
+                break
+            try:
+                results = self.hands.process(rgb_frame)
+                landmarks = results.multi_hand_landmarks[0].landmark if results.multi_hand_landmarks else None
+                last_error = None
+            except Exception as e:
+                # Report "no hand" rather than leaving a stale pose (e.g. a click) in place
+                landmarks = None
+                if repr(e) != last_error:
+                    last_error = repr(e)
+                    print(f"⚠️ Hand detection failed: {e}")
+            finally:
+                self._rgb_free.put(rgb_frame)
             
-        smoothed_x = (self.config.smoothing_factor * new_pos[0] + 
-                     (1 - self.config.smoothing_factor) * self.hand_state.last_position[0])
-        smoothed_y = (self.config.smoothing_factor * new_pos[1] + 
-                     (1 - self.config.smoothing_factor) * self.hand_state.last_position[1])
+            try:
+                self._infer_out.get_nowait()
+            except queue.Empty:
+                pass
+            self._infer_out.put(landmarks)
+    
+    def _next_rgb_buffer(self, shape):
+        """Return a writable RGB buffer that no pending detection is reading"""
+        rgb = self._rgb if self.landmarker is not None else self._rgb_free.get()
+        if rgb is None or rgb.shape != shape:
+            rgb = np.empty(shape, dtype=np.uint8)
+        if self.landmarker is not None:
+            self._rgb = rgb
+        rgb.flags.writeable = True
+        return rgb
+    
+    def _scene_changed(self, frame) -> bool:
+        """Cheap motion check against the last frame sent to hand detection"""
+        tiny_size = (64, max(1, frame.shape[0] * 64 // frame.shape[1]))
+        tiny = cv2.cvtColor(cv2.resize(frame, tiny_size, interpolation=cv2.INTER_AREA),
+                            cv2.COLOR_BGR2GRAY)
+        if (self._prev_tiny is not None and self._prev_tiny.shape == tiny.shape
+                and self._skipped_detections < MAX_SKIPPED_DETECTIONS
+                and cv2.absdiff(tiny, self._prev_tiny).mean() < MOTION_THRESHOLD):
+            self._skipped_detections += 1
+            return False
         
-        self.hand_state.last_position = (smoothed_x, smoothed_y)
-        return (smoothed_x, smoothed_y)
+        self._prev_tiny = tiny
+        self._skipped_detections = 0
+        return True
     
-    def detect_gesture(self, landmarks) -> Optional[str]:
+    def detect_gesture(self, landmarks, current_time: float) -> Optional[str]:
         """Advanced gesture detection with confidence scoring"""
         try:
-            # Get key landmark positions
-            index_tip = landmarks[8]
-            thumb_tip = landmarks[4]
-            middle_tip = landmarks[12]
-            index_mcp = landmarks[5]
-            ring_tip = landmarks[16]
-            pinky_tip = landmarks[20]
-            
-            # Calculate distances in normalized coordinates
-            thumb_index_dist = self.calculate_distance(
-                (thumb_tip.x, thumb_tip.y), 
-                (index_tip.x, index_tip.y)
-            )
-            index_middle_dist = self.calculate_distance(
-                (index_tip.x, index_tip.y), 
-                (middle_tip.x, middle_tip.y)
-            )
-            thumb_index_mcp_dist = self.calculate_distance(
-                (thumb_tip.x, thumb_tip.y), 
-                (index_mcp.x, index_mcp.y)
-            )
-            thumb_ring_dist = self.calculate_distance(
-                (thumb_tip.x, thumb_tip.y), 
-                (ring_tip.x, ring_tip.y)
-            )
-            thumb_pinky_dist = self.calculate_distance(
-                (thumb_tip.x, thumb_tip.y), 
-                (pinky_tip.x, pinky_tip.y)
-            )
-            
-            current_time = time.time()
-            
             # Gesture detection with cooldown
             if current_time - self.last_gesture_time < self.gesture_cooldown:
                 return self.hand_state.gesture_active
             
-            # Detect gestures based on distances
-            if thumb_index_dist < self.config.click_threshold:
-                self.last_gesture_time = current_time
-                self.hand_state.gesture_active = "click"
-                return "click"
-            elif index_middle_dist < self.config.double_click_threshold:
-                self.last_gesture_time = current_time
-                self.hand_state.gesture_active = "double_click"
-                return "double_click"
-            elif thumb_index_mcp_dist < self.config.right_click_threshold:
-                self.last_gesture_time = current_time
-                self.hand_state.gesture_active = "right_click"
-                return "right_click"
-            elif thumb_ring_dist < self.config.scroll_threshold:
-                self.last_gesture_time = current_time
-                self.hand_state.gesture_active = "scroll_up"
-                return "scroll_up"
-            elif thumb_pinky_dist < self.config.scroll_threshold:
-                self.last_gesture_time = current_time
-                self.hand_state.gesture_active = "scroll_down"
-                return "scroll_down"
-            elif thumb_index_dist < self.config.move_threshold:
-                self.hand_state.gesture_active = "move"
-                return "move"
-            else:
+            # Squared distances in normalized coordinates against the squared thresholds
+            winner = _classify_gesture(landmarks, self._thr)
+            if winner < 0:
                 self.hand_state.gesture_active = None
                 return None
-                
+            
+            gesture = GESTURE_NAMES[winner]
+            # Moving is continuous and does not start the cooldown
+            if gesture != "move":
+                self.last_gesture_time = current_time
+            self.hand_state.gesture_active = gesture
+            return gesture
+            
         except (IndexError, AttributeError):
             return None
     
-    def execute_action(self, gesture: str, landmarks):
+    def execute_action(self, gesture: str, landmarks, current_time: float):
         """Execute mouse actions based on detected gestures"""
-        current_time = time.time()
-        
         if gesture == "click" and current_time - self.hand_state.last_click_time > self.config.action_cooldown:
-            pyautogui.click()
+            self.mouse.click()
             self.hand_state.last_click_time = current_time
-            print("🖱️ Click")
+            self._log_q.append("🖱️ Click")
             
         elif gesture == "double_click" and current_time - self.hand_state.last_click_time > self.config.action_cooldown:
-            pyautogui.doubleClick()
+            self.mouse.double_click()
             self.hand_state.last_click_time = current_time
-            print("🖱️ Double Click")
+            self._log_q.append("🖱️ Double Click")
             
         elif gesture == "right_click" and current_time - self.hand_state.last_click_time > self.config.action_cooldown:
-            pyautogui.rightClick()
+            self.mouse.right_click()
             self.hand_state.last_click_time = current_time
-            print("🖱️ Right Click")
+            self._log_q.append("🖱️ Right Click")
             
         elif gesture == "scroll_up":
-            pyautogui.scroll(3)
-            print("⬆️ Scroll Up")
+            self._queue_scroll(3, current_time)
+            self._log_q.append("⬆️ Scroll Up")
             
         elif gesture == "scroll_down":
-            pyautogui.scroll(-3)
-            print("⬇️ Scroll Down")
+            self._queue_scroll(-3, current_time)
+            self._log_q.append("⬇️ Scroll Down")
             
         elif gesture == "move":
-            # Get index finger position
-            index_tip = landmarks[8]
-            screen_x = int(index_tip.x * self.screen_width)
-            screen_y = int(index_tip.y * self.screen_height)
-            
-            # Apply smoothing
-            smoothed_pos = self.smooth_position((screen_x, screen_y))
+            # Map the index fingertip to screen pixels, smooth and clamp in one pass
+            x, y = landmarks[8, :2].tolist()
+            ix = x * self._sx
+            iy = y * self._sy
+            if self._last_x is None:
+                sx, sy = ix, iy
+            else:
+                sx = self._sf * ix + self._one_minus_sf * self._last_x
+                sy = self._sf * iy + self._one_minus_sf * self._last_y
+            self._last_x, self._last_y = sx, sy
             
             # Move mouse with bounds checking
-            bounded_x = max(0, min(self.screen_width - 1, int(smoothed_pos[0])))
-            bounded_y = max(0, min(self.screen_height - 1, int(smoothed_pos[1])))
+            bounded_x = 0 if sx < 0 else (self._sx_max if sx > self._sx_max else int(sx))
+            bounded_y = 0 if sy < 0 else (self._sy_max if sy > self._sy_max else int(sy))
             
-            pyautogui.moveTo(bounded_x, bounded_y)
+            # Only emit when the cursor actually moves (ignore 1 px jitter)
+            last_x, last_y = self._last_emitted_xy
+            if abs(bounded_x - last_x) + abs(bounded_y - last_y) >= 2:
+                self.mouse.move(bounded_x, bounded_y)
+                self._last_emitted_xy = (bounded_x, bounded_y)
+    
+    def _queue_scroll(self, amount: int, current_time: float):
+        """Accumulate scroll steps and emit at most one scroll event per SCROLL_EMIT_INTERVAL"""
+        self._scroll_accum += amount
+        if current_time - self._last_scroll_emit > SCROLL_EMIT_INTERVAL:
+            self._flush_scroll(current_time)
     
-    def draw_interface(self, frame, hand_landmarks, gesture):
+    def _flush_scroll(self, current_time: float):
+        """Emit any pending scroll steps now"""
+        if self._scroll_accum:
+            self.mouse.scroll(self._scroll_accum)
+        self._scroll_accum = 0
+        self._last_scroll_emit = current_time
+    
+    def draw_interface(self, frame, landmarks, gesture):
         """Draw enhanced visual interface"""
-        landmarks = hand_landmarks.landmark
+        # Scale all landmarks to pixel coordinates at once
+        scale = (frame.shape[1], frame.shape[0])
+        points = [tuple(p) for p in (landmarks[:, :2] * scale).astype(np.int32).tolist()]
         
         # Draw hand landmarks with custom styling
-        self.mp_drawing.draw_landmarks(
-            frame, hand_landmarks, self.mp_hands.HAND_CONNECTIONS,
-            self.mp_drawing.DrawingSpec(color=(0, 255, 0), thickness=2, circle_radius=2),
-            self.mp_drawing.DrawingSpec(color=(0, 0, 255), thickness=2)
-        )
+        for start, end in HAND_CONNECTIONS:
+            cv2.line(frame, points[start], points[end], (0, 0, 255), 2)
+        for point in points:
+            cv2.circle(frame, point, 2, (0, 255, 0), 2)
         
         # Highlight key points
-        key_points = [8, 4, 12, 5, 16, 20]  # Index, thumb, middle, index base, ring, pinky
         colors = [(255, 255, 0), (255, 0, 255), (0, 255, 255), (255, 165, 0), (0, 255, 0), (255, 0, 0)]
         
-        for i, point_id in enumerate(key_points):
-            if point_id < len(landmarks):
-                x = int(landmarks[point_id].x * frame.shape[1])
-                y = int(landmarks[point_id].y * frame.shape[0])
-                cv2.circle(frame, (x, y), 8, colors[i], -1)
-                cv2.circle(frame, (x, y), 10, (255, 255, 255), 2)
+        for point_id, color in zip(GESTURE_LANDMARKS, colors):
+            cv2.circle(frame, points[point_id], 8, color, -1)
+            cv2.circle(frame, points[point_id], 10, (255, 255, 255), 2)
         
         # Draw gesture indicator
         if gesture:
             gesture_text = gesture.replace('_', ' ').title()
-            cv2.rectangle(frame, (10, 10), (250, 60), (0, 0, 0), -1)
+            frame[10:61, 10:251] = 0  # Gesture label background
             cv2.putText(frame, f"Gesture: {gesture_text}", (20, 40), 
                        cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
         
         # Draw FPS counter
-        self.frame_count += 1
-        if self.frame_count % 30 == 0:
-            self.fps = 30 / (time.time() - self.start_time)
-            self.start_time = time.time()
-        
         cv2.putText(frame, f"FPS: {self.fps:.1f}", (frame.shape[1] - 100, 30), 
                    cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
         
-        # Draw instructions
-        instructions = [
-            "Move: Thumb + Index close",
-            "Click: Thumb + Index very close", 
-            "Double Click: Index + Middle close",
-            "Right Click: Thumb + Index base close",
-            "Scroll: Thumb + Ring/Pinky close",
-            "Press 'q' to quit"
-        ]
+        # Draw instructions from the cached overlay (text pixels only)
+        if self._instr_overlay is None or self._instr_shape != frame.shape:
+            self._build_instructions_overlay(frame.shape)
+        np.copyto(frame[self._instr_top:], self._instr_overlay, where=self._instr_mask)
+    
+    def _build_instructions_overlay(self, frame_shape):
+        """Render the static instructions panel once so frames only need a masked copy"""
+        height, width = frame_shape[:2]
+        self._instr_top = max(0, height - 140 - 15)  # Leave room above the first baseline
         
-        for i, instruction in enumerate(instructions):
-            y_pos = frame.shape[0] - 140 + i * 22
-            cv2.putText(frame, instruction, (10, y_pos), 
+        overlay = np.zeros((height - self._instr_top, width, 3), dtype=np.uint8)
+        for i, instruction in enumerate(INSTRUCTIONS):
+            y_pos = height - 140 + i * 22 - self._instr_top
+            cv2.putText(overlay, instruction, (10, y_pos), 
                        cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255, 255, 255), 1)
+        
+        self._instr_overlay = overlay
+        self._instr_mask = overlay.any(axis=2, keepdims=True)
+        self._instr_shape = frame_shape
     
     def run(self):
         """Main execution loop"""
@@ -253,41 +540,79 @@ class VirtualMouse:
         
         try:
             while True:
-                ret, frame = self.cap.read()
-                if not ret:
+                frame = self.cam.read()
+                if frame is None:
                     print("Error: Could not read frame")
                     break
                 
+                # Read the clock once per frame and share it with every stage
+                now = time.perf_counter()
+                
                 # Flip frame horizontally for mirror effect
                 frame = cv2.flip(frame, 1)
                 
-                # Convert to RGB for MediaPipe
-                rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                results = self.hands.process(rgb_frame)
+                # Downscale for inference only; drawing still uses the full frame
+                inference_frame = frame
+                if frame.shape[1] > MAX_INFERENCE_WIDTH:
+                    size = (MAX_INFERENCE_WIDTH, frame.shape[0] * MAX_INFERENCE_WIDTH // frame.shape[1])
+                    if self._small is None or self._small.shape[:2] != (size[1], size[0]):
+                        self._small = np.empty((size[1], size[0], 3), dtype=np.uint8)
+                    cv2.resize(frame, size, dst=self._small, interpolation=cv2.INTER_AREA)
+                    inference_frame = self._small
+                
+                if self._scene_changed(inference_frame):
+                    # Convert to RGB for MediaPipe into the next reused buffer
+                    rgb = self._next_rgb_buffer(inference_frame.shape)
+                    cv2.cvtColor(inference_frame, cv2.COLOR_BGR2RGB, dst=rgb)
+                    # Read-only input lets MediaPipe skip its defensive copy
+                    rgb.flags.writeable = False
+                    self.detect_hands(rgb, now)
                 
-                if results.multi_hand_landmarks:
-                    hand_landmarks = results.multi_hand_landmarks[0]
-                    landmarks = hand_landmarks.landmark
+                # Detection runs concurrently; use whichever result finished last
+                landmarks = self.latest_landmarks()
+                
+                gesture = None
+                if landmarks is not None:
+                    # Materialize the landmarks once; everything downstream works on the array
+                    landmarks = _landmarks_to_np(landmarks)
                     
                     # Detect gesture
-                    gesture = self.detect_gesture(landmarks)
+                    gesture = self.detect_gesture(landmarks, now)
                     
                     # Execute action
                     if gesture:
-                        self.execute_action(gesture, landmarks)
+                        self.execute_action(gesture, landmarks, now)
+                
+                # Send steps still pending from a scroll gesture that just ended
+                if self._scroll_accum and gesture not in ("scroll_up", "scroll_down"):
+                    self._flush_scroll(now)
+                
+                # FPS counter measures the tracking loop
+                elapsed = now - self._last_tick
+                self._last_tick = now
+                if elapsed > 0:
+                    self.fps = 1 / elapsed if self.fps == 0 else 0.9 * self.fps + 0.1 / elapsed
+                
+                # Draw and display at a capped rate
+                if now - self._last_display >= self._display_interval:
+                    self._last_display = now
+                    if landmarks is not None:
+                        # Draw interface
+                        self.draw_interface(frame, landmarks, gesture)
+                    else:
+                        # Show "No hand detected" message
+                        cv2.putText(frame, "No hand detected", (frame.shape[1]//2 - 100, frame.shape[0]//2), 
+                                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 2)
                     
-                    # Draw interface
-                    self.draw_interface(frame, hand_landmarks, gesture)
+                    # Display frame
+                    cv2.imshow('Enhanced Virtual Mouse', frame)
+                    key = cv2.waitKey(1)
                 else:
-                    # Show "No hand detected" message
-                    cv2.putText(frame, "No hand detected", (frame.shape[1]//2 - 100, frame.shape[0]//2), 
-                               cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 2)
-                
-                # Display frame
-                cv2.imshow('Enhanced Virtual Mouse', frame)
+                    # Non-blocking check so the quit key still works between redraws
+                    key = cv2.pollKey()
                 
                 # Exit on 'q' key
-                if cv2.waitKey(1) & 0xFF == ord('q'):
+                if key & 0xFF == ord('q'):
                     break
                     
         except KeyboardInterrupt:
@@ -297,9 +622,17 @@ class VirtualMouse:
     
     def cleanup(self):
         """Clean up resources"""
-        self.cap.release()
+        self.cam.release()
         cv2.destroyAllWindows()
-        self.hands.close()
+        if self.hands is not None:
+            # Stop the inference worker before closing the graph it uses. No timeout:
+            # it exits as soon as the current process() call returns
+            self._submit_inference(None)
+            self._infer_thread.join()
+        (self.landmarker or self.hands).close()
+        # Let the log thread write out the remaining action messages and exit
+        self._log_stopped = True
+        self._log_thread.join()
         print("✅ Resources cleaned up")
 
 def main():